@@ -3,11 +3,47 @@
 import streamlit as st
 import pandas as pd  # Import pandas for displaying tables
 from simulations.simulation import Simulation
+from simulations._core import warm_up_core
 from visuals.plots import plot_beta_distributions, plot_performance_metrics, plot_recall_over_time
 from utils.helpers import calculate_recall
 
+@st.cache_resource(show_spinner="Compiling the simulation loop...")
+def compile_simulation():
+    """
+    Compiles the simulation loop once per server process instead of on the first "Run Simulation" click.
+    Simulations themselves stay in st.session_state, as each browser session runs its own.
+    """
+    warm_up_core()
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def counts_table(counts):
+    """
+    Builds the model selection counts table.
+
+    Parameters:
+        counts (tuple): (model name, selection count) pairs.
+
+    Returns:
+        pd.DataFrame: The table with 'Model' and 'Selection Count' columns.
+    """
+    return pd.DataFrame(list(counts), columns=['Model', 'Selection Count'])
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def prior_updates_table(updates):
+    """
+    Builds the prior update log table.
+
+    Parameters:
+        updates (tuple): Prior update log entries, ordered like Simulation.PRIOR_UPDATE_LOG_COLUMNS.
+
+    Returns:
+        pd.DataFrame: The table with one row per prior update.
+    """
+    return pd.DataFrame(list(updates), columns=Simulation.PRIOR_UPDATE_LOG_COLUMNS)
+
 def main():
     st.title("Thompson Sampling Demo for Fraud Detection")
+    compile_simulation()
 
     # Sidebar controls for model parameters
     st.sidebar.header("Simulation Parameters")
@@ -35,8 +71,7 @@ def main():
     num_steps = st.sidebar.number_input('Number of Simulation Steps', min_value=1, max_value=1000, value=1)
 
     if st.button('Run Simulation'):
-        for _ in range(num_steps):
-            selected_model = st.session_state.simulation.run_step()
+        selected_model = st.session_state.simulation.run_steps(num_steps)
         st.session_state.selected_model = selected_model  # Store the last selected model
         st.success(f"Ran {num_steps} simulation steps.")
 
@@ -49,10 +84,7 @@ def main():
     # Display model selection counts
     st.subheader("Model Selection Counts")
     model_counts = st.session_state.simulation.model_selection_counts
-    counts_df = pd.DataFrame.from_dict(model_counts, orient='index', columns=['Selection Count'])
-    counts_df.index.name = 'Model'
-    counts_df = counts_df.reset_index()
-    st.table(counts_df)
+    st.table(counts_table(tuple(model_counts.items())))
 
     # Plot priors
     st.subheader("Model Priors")
@@ -72,9 +104,8 @@ def main():
     if prior_update_log:
         # Display last N updates
         N = 10
-        recent_updates = prior_update_log[-N:]
-        updates_df = pd.DataFrame(recent_updates)
-        st.table(updates_df)
+        recent_updates = tuple(prior_update_log)[-N:]
+        st.table(prior_updates_table(recent_updates))
     else:
         st.write("No prior updates yet.")
 
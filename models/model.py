@@ -7,13 +7,14 @@ class SyntheticModel:
     Represents a synthetic predictive model with an adjustable recall rate.
     """
 
-    def __init__(self, name: str, recall_rate: float):
+    def __init__(self, name: str, recall_rate: float, rng: np.random.Generator = None):
         """
         Initializes the SyntheticModel with a given name and recall rate.
 
         Parameters:
             name (str): The name of the model.
             recall_rate (float): The recall rate of the model, between 0 and 1.
+            rng (np.random.Generator, optional): Random number generator to draw from. Default is a new unseeded generator.
 
         Raises:
             ValueError: If recall_rate is not between 0 and 1.
@@ -22,6 +23,7 @@ class SyntheticModel:
             raise ValueError("recall_rate must be between 0 and 1.")
         self.name = name
         self.recall_rate = recall_rate
+        self.rng = rng if rng is not None else np.random.default_rng()
 
     def predict(self, transaction: dict) -> int:
         """
@@ -39,7 +41,7 @@ class SyntheticModel:
         """
         if transaction['label'] == 1:
             # Fraudulent transaction
-            prediction = 1 if np.random.rand() < self.recall_rate else 0
+            prediction = 1 if self.rng.random() < self.recall_rate else 0
         else:
             # Legitimate transaction
             prediction = 0  # Assuming perfect precision
@@ -8,17 +8,19 @@ class ThompsonSampling:
 
     Attributes:
         models (list): A list of models to select from.
-        priors (dict): A dictionary containing the Beta distribution parameters ('alpha' and 'beta') for each model.
+        alphas (np.ndarray): The Beta distribution 'alpha' parameter of each model, in the order of `models`.
+        betas (np.ndarray): The Beta distribution 'beta' parameter of each model, in the order of `models`.
         decay_rate (float): The rate at which to decay the priors (0 < decay_rate ≤ 1).
     """
 
-    def __init__(self, models, decay_rate: float = 1.0):
+    def __init__(self, models, decay_rate: float = 1.0, rng: np.random.Generator = None):
         """
         Initializes the ThompsonSampling instance.
 
         Parameters:
             models (list): A list of model instances.
             decay_rate (float, optional): The decay rate for priors. Must be between 0 (exclusive) and 1 (inclusive). Default is 1.0.
+            rng (np.random.Generator, optional): Random number generator to sample from. Default is a new unseeded generator.
 
         Raises:
             ValueError: If decay_rate is not between 0 and 1.
@@ -26,8 +28,37 @@ class ThompsonSampling:
         if not 0 < decay_rate <= 1:
             raise ValueError("decay_rate must be between 0 (exclusive) and 1 (inclusive).")
         self.models = models
-        self.priors = {model.name: {'alpha': 1.0, 'beta': 1.0} for model in models}
+        self._names = [model.name for model in models]
+        self._idx = {name: i for i, name in enumerate(self._names)}
+        self.alphas = np.ones(len(models))
+        self.betas = np.ones(len(models))
         self.decay_rate = decay_rate
+        self.rng = rng if rng is not None else np.random.default_rng()
+
+    @property
+    def priors(self) -> dict:
+        """
+        The Beta distribution parameters of each model.
+
+        Returns:
+            dict: A dictionary mapping each model name to a dictionary with 'alpha' and 'beta' keys.
+        """
+        return {
+            name: {'alpha': float(alpha), 'beta': float(beta)}
+            for name, alpha, beta in zip(self._names, self.alphas, self.betas)
+        }
+
+    def model_index(self, model_name: str) -> int:
+        """
+        Returns the position of a model in `models`, `alphas` and `betas`.
+
+        Parameters:
+            model_name (str): The name of the model.
+
+        Returns:
+            int: The index of the model.
+        """
+        return self._idx[model_name]
 
     def select_model(self) -> str:
         """
@@ -36,13 +67,45 @@ class ThompsonSampling:
         Returns:
             str: The name of the selected model with the highest sampled recall.
         """
-        sampled_recalls = {}
-        for model in self.models:
-            alpha = self.priors[model.name]['alpha']
-            beta = self.priors[model.name]['beta']
-            sampled_recalls[model.name] = np.random.beta(alpha, beta)
-        selected_model_name = max(sampled_recalls, key=sampled_recalls.get)
-        return selected_model_name
+        if len(self._names) == 2:
+            return self._select_two_models()
+
+        # Scalar draws are cheaper than one broadcast call for a handful of models
+        sampled_recalls = [
+            self.rng.beta(alpha, beta) for alpha, beta in zip(self.alphas.tolist(), self.betas.tolist())
+        ]
+        return self._names[sampled_recalls.index(max(sampled_recalls))]
+
+    def _select_two_models(self) -> str:
+        """
+        Selects between exactly two models by comparing one Beta sample from each.
+
+        Returns:
+            str: The name of the selected model (the first one on ties, like `select_model`).
+        """
+        (alpha_0, alpha_1), (beta_0, beta_1) = self.alphas.tolist(), self.betas.tolist()
+        if self.rng.beta(alpha_0, beta_0) >= self.rng.beta(alpha_1, beta_1):
+            return self._names[0]
+        return self._names[1]
+
+    def sample_batch(self, n: int) -> np.ndarray:
+        """
+        Selects models for n independent decisions made with the current priors.
+
+        Parameters:
+            n (int): The number of decisions.
+
+        Returns:
+            np.ndarray: The index of the selected model for each decision (see `model_index`).
+        """
+        if len(self._names) == 2:
+            # Compare the two sample vectors directly instead of stacking them for argmax
+            first = self.rng.beta(self.alphas[0], self.betas[0], size=n)
+            second = self.rng.beta(self.alphas[1], self.betas[1], size=n)
+            return (second > first).astype(np.intp)
+
+        sampled_recalls = self.rng.beta(self.alphas, self.betas, size=(n, len(self.alphas)))
+        return np.argmax(sampled_recalls, axis=1)
 
     def update_prior(self, model_name: str, outcome: int):
         """
@@ -58,12 +121,14 @@ class ThompsonSampling:
         if outcome not in [0, 1]:
             raise ValueError("Outcome must be 1 (true positive) or 0 (false negative).")
 
+        i = self._idx[model_name]
+
         # Apply decay to priors
-        self.priors[model_name]['alpha'] *= self.decay_rate
-        self.priors[model_name]['beta'] *= self.decay_rate
+        self.alphas[i] *= self.decay_rate
+        self.betas[i] *= self.decay_rate
 
         # Update with new outcome
         if outcome == 1:
-            self.priors[model_name]['alpha'] += 1
+            self.alphas[i] += 1
         else:
-            self.priors[model_name]['beta'] += 1
+            self.betas[i] += 1
@@ -0,0 +1,87 @@
+# simulations/_core.py
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; Simulation falls back to its NumPy implementation
+    njit = None
+
+NUMBA_AVAILABLE = njit is not None
+
+
+def simulate_core(recall_rates, alphas, betas, decay_rate, item_label, item_pred, item_model,
+                  processed_at, first_iteration, num_pending, seed):
+    """
+    Simulates consecutive iterations of Thompson Sampling with delayed feedback in a single compiled loop.
+
+    The feedback items are laid out in queue order: the first `num_pending` entries are feedback
+    already waiting in the queue, followed by one entry per new iteration. Labels of all items and
+    predictions/models of the pending items must be filled in; the predictions and selected models
+    of the new iterations are written in place.
+
+    Parameters:
+        recall_rates (np.ndarray): float64 recall rate of each model.
+        alphas (np.ndarray): float64 Beta alpha parameter of each model, updated in place.
+        betas (np.ndarray): float64 Beta beta parameter of each model, updated in place.
+        decay_rate (float): Decay applied to a model's priors before each update.
+        item_label (np.ndarray): int8 ground truth label of each feedback item.
+        item_pred (np.ndarray): int8 prediction of each feedback item.
+        item_model (np.ndarray): int64 index of the model that made each prediction.
+        processed_at (np.ndarray): int64 iteration at whose end each feedback item is processed.
+        first_iteration (int): Iteration number of the first new iteration.
+        num_pending (int): Number of feedback items that were already queued.
+        seed (int): Seed for the random number generator used inside the loop.
+    """
+    np.random.seed(seed)
+    num_models = recall_rates.shape[0]
+    num_items = item_label.shape[0]
+    head = 0
+    for i in range(num_pending, num_items):
+        iteration = first_iteration + i - num_pending
+
+        # Select the model with the highest sampled recall
+        selected = 0
+        best_sample = -1.0
+        for m in range(num_models):
+            sample = np.random.beta(alphas[m], betas[m])
+            if sample > best_sample:
+                selected = m
+                best_sample = sample
+        item_model[i] = selected
+
+        # Perfect precision: only fraudulent transactions can be flagged
+        if item_label[i] == 1 and np.random.random() < recall_rates[selected]:
+            item_pred[i] = 1
+        else:
+            item_pred[i] = 0
+
+        # Process the feedback that is due at the end of this iteration
+        while head < num_items and processed_at[head] <= iteration:
+            if item_label[head] == 1:
+                m = item_model[head]
+                alphas[m] *= decay_rate
+                betas[m] *= decay_rate
+                if item_pred[head] == 1:
+                    alphas[m] += 1.0
+                else:
+                    betas[m] += 1.0
+            head += 1
+
+
+if NUMBA_AVAILABLE:
+    simulate_core = njit(cache=True)(simulate_core)
+
+
+def warm_up_core():
+    """
+    Compiles `simulate_core` (or loads it from Numba's cache) for the argument types used by Simulation.
+    Does nothing when Numba is not installed.
+    """
+    if not NUMBA_AVAILABLE:
+        return
+    simulate_core(
+        np.ones(1), np.ones(1), np.ones(1), 1.0,
+        np.zeros(1, dtype=np.int8), np.zeros(1, dtype=np.int8), np.zeros(1, dtype=np.int64),
+        np.ones(1, dtype=np.int64), 1, 0, 0
+    )
@@ -1,10 +1,12 @@
 # simulations/simulation.py
 
 from collections import deque
+import numpy as np
 from models.model import SyntheticModel
 from models.thompson_sampling import ThompsonSampling
 from data.transactions import TransactionGenerator
-from utils.helpers import calculate_metrics, initialize_metrics
+from utils.helpers import calculate_metrics, calculate_recall, initialize_metrics, METRIC_KEYS
+from simulations._core import NUMBA_AVAILABLE, simulate_core
 
 class Simulation:
     """
@@ -15,15 +17,23 @@ class Simulation:
         models (list): List of SyntheticModel instances.
         thompson_sampler (ThompsonSampling): Instance of the ThompsonSampling algorithm.
         feedback_delay (int): Number of iterations to delay feedback.
-        feedback_queue (deque): Queue to manage delayed feedback.
+        feedback_labels (np.ndarray): Ring buffer of the transaction labels awaiting feedback.
+        feedback_predictions (np.ndarray): Ring buffer of the predictions awaiting feedback.
+        feedback_models (np.ndarray): Ring buffer of the indices of the models that made those predictions.
+        next_feedback_iteration (int): First iteration whose feedback has not been processed yet.
         current_iteration (int): Current iteration count of the simulation.
         metrics (dict): Dictionary to track performance metrics.
-        metrics_history (list): List of metrics over time for visualization.
+        metrics_history (dict): Metric counts and recall after each processed fraud feedback, for visualization.
         model_selection_counts (dict): Counts of how many times each model was selected.
-        prior_update_log (list): Log of prior updates for each model.
+        prior_update_log (deque): Most recent prior updates, as tuples ordered like PRIOR_UPDATE_LOG_COLUMNS.
+        rng (np.random.Generator): Random number generator shared by all components of the simulation.
     """
 
-    def __init__(self, recall_A, recall_B, feedback_delay, fraud_rate=0.05, decay_rate=1.0):
+    HISTORY_CAPACITY = 1024  # Initial number of metrics history entries to allocate
+    PRIOR_UPDATE_LOG_SIZE = 64  # Number of prior updates kept in the log
+    PRIOR_UPDATE_LOG_COLUMNS = ('Iteration', 'Model', 'Outcome', 'Old Alpha', 'Old Beta', 'New Alpha', 'New Beta')
+
+    def __init__(self, recall_A, recall_B, feedback_delay, fraud_rate=0.05, decay_rate=1.0, seed=None):
         """
         Initializes the Simulation.
 
@@ -33,6 +43,7 @@ class Simulation:
             feedback_delay (int): Delay in iterations before feedback is received.
             fraud_rate (float, optional): Base fraud rate in the transaction data (between 0 and 1). Default is 0.05.
             decay_rate (float, optional): Decay rate for exponential decay in priors (0 < decay_rate ≤ 1). Default is 1.0.
+            seed (int, optional): Seed for the random number generator, for reproducible runs. Default is None.
 
         Raises:
             ValueError: If any of the parameters are outside their valid ranges.
@@ -49,23 +60,73 @@ class Simulation:
         if not 0 < decay_rate <= 1:
             raise ValueError("decay_rate must be between 0 (exclusive) and 1 (inclusive).")
 
-        self.transaction_generator = TransactionGenerator(fraud_rate)
+        self.rng = np.random.default_rng(seed)
+        self.transaction_generator = TransactionGenerator(fraud_rate, self.rng)
         self.models = [
-            SyntheticModel('Model A', recall_A),
-            SyntheticModel('Model B', recall_B)
+            SyntheticModel('Model A', recall_A, self.rng),
+            SyntheticModel('Model B', recall_B, self.rng)
         ]
-        self.thompson_sampler = ThompsonSampling(self.models, decay_rate=decay_rate)
+        self._models_by_name = {model.name: model for model in self.models}
+        self.thompson_sampler = ThompsonSampling(self.models, decay_rate=decay_rate, rng=self.rng)
         self.feedback_delay = feedback_delay
-        self.feedback_queue = deque()
+
+        # Feedback of iteration i is kept in slot i % len(self.feedback_labels) until it is processed
+        self.feedback_labels = np.zeros(feedback_delay + 1, dtype=np.int8)
+        self.feedback_predictions = np.zeros(feedback_delay + 1, dtype=np.int8)
+        self.feedback_models = np.zeros(feedback_delay + 1, dtype=np.int8)
+        self.next_feedback_iteration = 1
+
         self.current_iteration = 0
         self.metrics = initialize_metrics()
-        self.metrics_history = []
+
+        # Metrics history, one preallocated array per metric plus recall, filled up to self._history_length
+        self._history = {key: np.zeros(self.HISTORY_CAPACITY, dtype=np.int64) for key in METRIC_KEYS}
+        self._history['recall'] = np.zeros(self.HISTORY_CAPACITY)
+        self._history_length = 0
 
         # Initialize model selection counts
         self.model_selection_counts = {model.name: 0 for model in self.models}
 
         # Initialize prior update log
-        self.prior_update_log = []
+        self.prior_update_log = deque(maxlen=self.PRIOR_UPDATE_LOG_SIZE)
+
+    @property
+    def metrics_history(self):
+        """
+        The metrics recorded after each processed fraud feedback.
+
+        Returns:
+            dict: A dictionary mapping each metric name to a NumPy array of its counts over time,
+                  and 'recall' to a NumPy array of the recall over time.
+                  The arrays are views into the simulation's buffers and must not be modified.
+        """
+        return {key: values[:self._history_length] for key, values in self._history.items()}
+
+    def record_metrics(self):
+        """
+        Appends the current metrics and recall to the metrics history, doubling the history buffers when they are full.
+        """
+        index = self._history_length
+        if index == len(self._history['recall']):
+            for key, values in self._history.items():
+                self._history[key] = np.resize(values, 2 * len(values))
+        for key in METRIC_KEYS:
+            self._history[key][index] = self.metrics[key]
+        self._history['recall'][index] = calculate_recall(self.metrics)
+        self._history_length = index + 1
+
+    def reserve(self, n):
+        """
+        Preallocates the metrics history so that n more entries can be recorded without reallocating.
+
+        Parameters:
+            n (int): Number of additional metrics history entries to make room for.
+        """
+        needed = self._history_length + n
+        for key, values in self._history.items():
+            if len(values) < needed:
+                self._history[key] = np.zeros(needed, dtype=values.dtype)
+                self._history[key][:self._history_length] = values[:self._history_length]
 
     def update_parameters(self, recall_A, recall_B, feedback_delay, fraud_rate=None, decay_rate=1.0):
         """
@@ -89,6 +150,8 @@ class Simulation:
         if feedback_delay < 0:
             raise ValueError("feedback_delay must be non-negative.")
         self.feedback_delay = feedback_delay
+        if feedback_delay + 1 > len(self.feedback_labels):
+            self._resize_feedback_buffer(feedback_delay + 1)
 
         # Update fraud rate if provided
         if fraud_rate is not None:
@@ -101,6 +164,22 @@ class Simulation:
             raise ValueError("decay_rate must be between 0 (exclusive) and 1 (inclusive).")
         self.thompson_sampler.decay_rate = decay_rate
 
+    def _resize_feedback_buffer(self, size):
+        """
+        Reallocates the feedback ring buffers with the given number of slots, keeping the pending feedback.
+
+        Parameters:
+            size (int): The new number of slots. Must be larger than the number of pending feedback items.
+        """
+        pending = np.arange(self.next_feedback_iteration, self.current_iteration + 1)
+        old_slots = pending % len(self.feedback_labels)
+        new_slots = pending % size
+        for name in ('feedback_labels', 'feedback_predictions', 'feedback_models'):
+            old = getattr(self, name)
+            new = np.zeros(size, dtype=old.dtype)
+            new[new_slots] = old[old_slots]
+            setattr(self, name, new)
+
     def run_step(self):
         """
         Executes a single iteration of the simulation.
@@ -118,7 +197,7 @@ class Simulation:
         self.current_iteration += 1
         transaction = self.transaction_generator.generate_transaction()
         selected_model_name = self.thompson_sampler.select_model()
-        selected_model = next(model for model in self.models if model.name == selected_model_name)
+        selected_model = self._models_by_name[selected_model_name]
 
         # Increment model selection count
         self.model_selection_counts[selected_model_name] += 1
@@ -128,64 +207,167 @@ class Simulation:
         self.process_feedback_queue()
         return selected_model_name
 
+    def run_steps(self, n):
+        """
+        Executes n iterations of the simulation in one call.
+
+        When Numba is installed, the iterations run in a single compiled loop (see
+        `simulations._core.simulate_core`). Otherwise, since priors only change when feedback for
+        a fraudulent transaction is processed, every stretch of iterations between two such
+        updates is sampled in one vectorized NumPy pass. Either way, prior updates are applied
+        in the same order and at the same iterations as repeated calls to `run_step`.
+
+        Parameters:
+            n (int): Number of iterations to run (at least 1).
+
+        Returns:
+            str: The name of the model selected in the last iteration.
+
+        Raises:
+            ValueError: If n is less than 1.
+        """
+        if n < 1:
+            raise ValueError("n must be at least 1.")
+
+        first = self.current_iteration + 1
+        last = self.current_iteration + n
+        names = [model.name for model in self.models]
+        recall_rates = np.array([model.recall_rate for model in self.models])
+
+        # Pending feedback followed by the feedback of the new iterations, one item per iteration
+        item_iteration = np.arange(self.next_feedback_iteration, last + 1)
+        num_pending = first - self.next_feedback_iteration
+        pending_slots = item_iteration[:num_pending] % len(self.feedback_labels)
+        item_label = np.empty(num_pending + n, dtype=np.int8)
+        item_pred = np.empty(num_pending + n, dtype=np.int8)
+        item_model = np.empty(num_pending + n, dtype=np.int64)
+        item_label[:num_pending] = self.feedback_labels[pending_slots]
+        item_pred[:num_pending] = self.feedback_predictions[pending_slots]
+        item_model[:num_pending] = self.feedback_models[pending_slots]
+        item_label[num_pending:] = self.rng.random(n) < self.transaction_generator.fraud_rate
+
+        # Feedback is processed at the end of the iteration feedback_delay iterations later, or at the
+        # end of the first new iteration if that point has already passed
+        processed_at = np.maximum(item_iteration + self.feedback_delay, first)
+        num_processed = max(0, min(num_pending + n, last - self.feedback_delay - self.next_feedback_iteration + 1))
+        fraud_items = np.flatnonzero(item_label[:num_processed])
+        self.reserve(len(fraud_items))
+
+        if NUMBA_AVAILABLE:
+            # The compiled loop works on copies of the priors; the real update is replayed below
+            seed = int(self.rng.integers(2**32))
+            simulate_core(
+                recall_rates, self.thompson_sampler.alphas.copy(), self.thompson_sampler.betas.copy(),
+                self.thompson_sampler.decay_rate,
+                item_label, item_pred, item_model, processed_at, first, num_pending, seed
+            )
+        else:
+            # Uniform draws deciding whether the selected model catches each new fraudulent transaction
+            detection_draws = self.rng.random(n)
+
+        def simulate(start, end):
+            # All new items in [start, end) are selected with the current priors
+            item_model[start:end] = self.thompson_sampler.sample_batch(end - start)
+            draws = detection_draws[start - num_pending:end - num_pending]
+            detected = draws < recall_rates[item_model[start:end]]
+            # Perfect precision: legitimate transactions are never flagged, so the label simply masks detections
+            item_pred[start:end] = item_label[start:end].astype(bool) & detected
+
+        start = num_pending
+        for i in fraud_items:
+            self.current_iteration = int(processed_at[i])
+            end = num_pending + self.current_iteration - first + 1
+            if not NUMBA_AVAILABLE and end > start:
+                simulate(start, end)
+                start = end
+            self.apply_feedback(1, int(item_pred[i]), names[item_model[i]])
+        if not NUMBA_AVAILABLE and start < num_pending + n:
+            simulate(start, num_pending + n)
+        self.current_iteration = last
+
+        counts = np.bincount(item_model[num_pending:], minlength=len(names))
+        for name, count in zip(names, counts):
+            self.model_selection_counts[name] += int(count)
+
+        # Store the feedback of the new iterations that is not due yet
+        self.next_feedback_iteration += num_processed
+        stored = slice(max(num_processed, num_pending), num_pending + n)
+        slots = item_iteration[stored] % len(self.feedback_labels)
+        self.feedback_labels[slots] = item_label[stored]
+        self.feedback_predictions[slots] = item_pred[stored]
+        self.feedback_models[slots] = item_model[stored]
+
+        return names[item_model[-1]]
+
     def add_to_feedback_queue(self, transaction, prediction, model_name):
         """
-        Adds a prediction to the feedback queue with the specified delay.
+        Adds the prediction made in the current iteration to the feedback ring buffers.
 
         Parameters:
             transaction (dict): The transaction data.
             prediction (int): The model's prediction (1 for fraud, 0 for legitimate).
             model_name (str): The name of the model that made the prediction.
         """
-        feedback = {
-            'iteration_due': self.current_iteration + self.feedback_delay,
-            'transaction': transaction,
-            'prediction': prediction,
-            'model_name': model_name
-        }
-        self.feedback_queue.append(feedback)
+        slot = self.current_iteration % len(self.feedback_labels)
+        self.feedback_labels[slot] = transaction['label']
+        self.feedback_predictions[slot] = prediction
+        self.feedback_models[slot] = self.thompson_sampler.model_index(model_name)
 
     def process_feedback_queue(self):
         """
-        Processes the feedback queue, updating priors and performance metrics when feedback is due.
-        Additionally, logs prior updates for verbosity.
-        """
-        while self.feedback_queue and self.feedback_queue[0]['iteration_due'] <= self.current_iteration:
-            feedback = self.feedback_queue.popleft()
-            transaction = feedback['transaction']
-            prediction = feedback['prediction']
-            model_name = feedback['model_name']
-
-            # Determine the outcome for Bayesian update
-            if transaction['label'] == 1:
-                outcome = 1 if prediction == 1 else 0  # 1: True Positive, 0: False Negative
-
-                # Store old priors before update for logging
-                old_alpha = self.thompson_sampler.priors[model_name]['alpha']
-                old_beta = self.thompson_sampler.priors[model_name]['beta']
-
-                # Update the prior for the selected model
-                self.thompson_sampler.update_prior(model_name, outcome)
-
-                # Store new priors after update
-                new_alpha = self.thompson_sampler.priors[model_name]['alpha']
-                new_beta = self.thompson_sampler.priors[model_name]['beta']
-
-                # Log the prior update
-                log_entry = {
-                    'Iteration': self.current_iteration,
-                    'Model': model_name,
-                    'Outcome': 'TP' if outcome == 1 else 'FN',
-                    'Old Alpha': old_alpha,
-                    'Old Beta': old_beta,
-                    'New Alpha': new_alpha,
-                    'New Beta': new_beta
-                }
-                self.prior_update_log.append(log_entry)
-
-                # Update performance metrics
-                self.metrics = calculate_metrics(self.metrics, transaction, prediction)
-                self.metrics_history.append(self.metrics.copy())
-            else:
-                # Optionally update metrics for legitimate transactions
-                pass  # Currently focusing on recall (fraud detection)
+        Processes the feedback of every iteration at least feedback_delay iterations old, updating priors
+        and performance metrics. Additionally, logs prior updates for verbosity.
+        """
+        while self.next_feedback_iteration <= self.current_iteration - self.feedback_delay:
+            slot = self.next_feedback_iteration % len(self.feedback_labels)
+            self.next_feedback_iteration += 1
+            self.apply_feedback(
+                int(self.feedback_labels[slot]),
+                int(self.feedback_predictions[slot]),
+                self.models[self.feedback_models[slot]].name
+            )
+
+    def apply_feedback(self, label, prediction, model_name):
+        """
+        Applies a single feedback event, updating priors and performance metrics for fraudulent transactions.
+
+        Parameters:
+            label (int): The ground truth label of the transaction (1 for fraud, 0 for legitimate).
+            prediction (int): The model's prediction (1 for fraud, 0 for legitimate).
+            model_name (str): The name of the model that made the prediction.
+        """
+        # Determine the outcome for Bayesian update
+        if label == 1:
+            outcome = 1 if prediction == 1 else 0  # 1: True Positive, 0: False Negative
+
+            sampler = self.thompson_sampler
+            i = sampler.model_index(model_name)
+
+            # Store old priors before update for logging
+            old_alpha = float(sampler.alphas[i])
+            old_beta = float(sampler.betas[i])
+
+            # Update the prior for the selected model
+            sampler.update_prior(model_name, outcome)
+
+            # Store new priors after update
+            new_alpha = float(sampler.alphas[i])
+            new_beta = float(sampler.betas[i])
+
+            # Log the prior update
+            self.prior_update_log.append((
+                self.current_iteration,
+                model_name,
+                'TP' if outcome == 1 else 'FN',
+                old_alpha,
+                old_beta,
+                new_alpha,
+                new_beta
+            ))
+
+            # Update performance metrics
+            calculate_metrics(self.metrics, label, prediction)
+            self.record_metrics()
+        else:
+            # Optionally update metrics for legitimate transactions
+            pass  # Currently focusing on recall (fraud detection)
@@ -1,8 +1,13 @@
 # utils/helpers.py
 
+METRIC_KEYS = ('true_positives', 'false_negatives', 'false_positives', 'true_negatives')
+
+# Metric to increment, indexed by true_label * 2 + prediction
+_OUTCOME_KEYS = ('true_negatives', 'false_positives', 'false_negatives', 'true_positives')
+
 def bayesian_update(prior, outcome):
     """
-    Updates the Beta distribution parameters (alpha and beta) based on the outcome.
+    Updates the Beta distribution parameters (alpha and beta) in place based on the outcome.
 
     **Note**: If you are using the `update_prior` method in the `ThompsonSampling` class
     (which handles exponential decay), you may not need this function directly.
@@ -13,44 +18,33 @@ def bayesian_update(prior, outcome):
         outcome (int): Outcome of the prediction (1 for true positive, 0 for false negative).
 
     Returns:
-        dict: Updated prior with incremented 'alpha' or 'beta'.
+        dict: The same prior, with 'alpha' or 'beta' incremented.
     """
-    updated_prior = prior.copy()
     if outcome == 1:
-        updated_prior['alpha'] += 1  # True positive
+        prior['alpha'] += 1  # True positive
     elif outcome == 0:
-        updated_prior['beta'] += 1   # False negative
+        prior['beta'] += 1   # False negative
     else:
         raise ValueError("Outcome must be 1 (true positive) or 0 (false negative).")
-    return updated_prior
+    return prior
 
-def calculate_metrics(metrics, transaction, prediction):
+def calculate_metrics(metrics, true_label, prediction):
     """
-    Updates performance metrics based on the transaction label and model's prediction.
+    Updates performance metrics in place based on the transaction label and model's prediction.
 
     Parameters:
         metrics (dict): Current performance metrics with keys:
                         'true_positives', 'false_negatives', 'false_positives', 'true_negatives'.
-        transaction (dict): The transaction data containing the 'label' key.
-                            - 'label' (int): The ground truth label (1 for fraud, 0 for legitimate).
+        true_label (int): The ground truth label of the transaction (1 for fraud, 0 for legitimate).
         prediction (int): The model's prediction (1 for fraud, 0 for legitimate).
 
     Returns:
-        dict: Updated metrics dictionary with incremented counts.
+        dict: The same metrics dictionary, with the matching count incremented.
     """
-    updated_metrics = metrics.copy()
-    true_label = transaction['label']
-    if true_label == 1 and prediction == 1:
-        updated_metrics['true_positives'] += 1
-    elif true_label == 1 and prediction == 0:
-        updated_metrics['false_negatives'] += 1
-    elif true_label == 0 and prediction == 1:
-        updated_metrics['false_positives'] += 1
-    elif true_label == 0 and prediction == 0:
-        updated_metrics['true_negatives'] += 1
-    else:
+    if true_label not in (0, 1) or prediction not in (0, 1):
         raise ValueError("Invalid transaction label or prediction value.")
-    return updated_metrics
+    metrics[_OUTCOME_KEYS[true_label * 2 + prediction]] += 1
+    return metrics
 
 def initialize_metrics():
     """
@@ -60,12 +54,7 @@ def initialize_metrics():
         dict: A dictionary with zeroed performance metrics:
               'true_positives', 'false_negatives', 'false_positives', 'true_negatives'.
     """
-    metrics = {
-        'true_positives': 0,
-        'false_negatives': 0,
-        'false_positives': 0,
-        'true_negatives': 0
-    }
+    metrics = {key: 0 for key in METRIC_KEYS}
     return metrics
 
 def calculate_recall(metrics):
@@ -1,10 +1,56 @@
 # visuals/plots.py
 
+import functools
 import streamlit as st
-import matplotlib.pyplot as plt
 import numpy as np
+import pandas as pd
+from matplotlib.figure import Figure  # Not pyplot, so cached figures are not also held by its figure manager
 from scipy.stats import beta
 
+PLOT_CACHE_ENTRIES = 32  # Number of figures kept in the plot cache
+
+_X = np.linspace(0, 1, 100)  # Recall values at which the Beta densities are plotted
+
+@functools.lru_cache(maxsize=256)
+def _beta_pdf(alpha, beta_param):
+    """
+    Evaluates the Beta density on the plot grid, memoized per (alpha, beta) pair.
+
+    Parameters:
+        alpha (float): The 'alpha' parameter of the Beta distribution.
+        beta_param (float): The 'beta' parameter of the Beta distribution.
+
+    Returns:
+        np.ndarray: The read-only density values at each point of `_X`.
+    """
+    y = beta.pdf(_X, alpha, beta_param)
+    y.setflags(write=False)
+    return y
+
+@st.cache_data(show_spinner=False, max_entries=PLOT_CACHE_ENTRIES)
+def _build_beta_fig(names, alphas, betas):
+    """
+    Builds the figure of the Beta distributions for each model's prior.
+
+    Parameters:
+        names (tuple): Model names.
+        alphas (tuple): The 'alpha' parameter of each model's Beta distribution.
+        betas (tuple): The 'beta' parameter of each model's Beta distribution.
+
+    Returns:
+        Figure: The matplotlib figure.
+    """
+    fig = Figure()
+    ax = fig.subplots()
+    for model_name, alpha, beta_param in zip(names, alphas, betas):
+        y = _beta_pdf(round(alpha, 6), round(beta_param, 6))
+        ax.plot(_X, y, label=model_name)
+    ax.set_title('Priors (Beta Distributions)')
+    ax.set_xlabel('Recall')
+    ax.set_ylabel('Density')
+    ax.legend()
+    return fig
+
 def plot_beta_distributions(priors):
     """
     Plots the Beta distributions representing the priors for each model.
@@ -17,75 +63,49 @@ def plot_beta_distributions(priors):
         A matplotlib plot embedded in the Streamlit app showing the Beta distributions
         for each model's prior.
     """
-    fig, ax = plt.subplots()
-    x = np.linspace(0, 1, 100)
-    for model_name, params in priors.items():
-        alpha = params['alpha']
-        beta_param = params['beta']
-        y = beta.pdf(x, alpha, beta_param)
-        ax.plot(x, y, label=model_name)
-    ax.set_title('Priors (Beta Distributions)')
-    ax.set_xlabel('Recall')
-    ax.set_ylabel('Density')
-    ax.legend()
-    st.pyplot(fig)
+    names = tuple(priors)
+    alphas = tuple(params['alpha'] for params in priors.values())
+    betas = tuple(params['beta'] for params in priors.values())
+    st.pyplot(_build_beta_fig(names, alphas, betas))
 
 def plot_performance_metrics(metrics_history):
     """
     Plots the performance metrics (True Positives and False Negatives) over time.
 
     Parameters:
-        metrics_history (list): A list of metrics dictionaries collected over iterations.
-                                Each dictionary contains counts of 'true_positives' and 'false_negatives'.
+        metrics_history (dict): Arrays of metric counts collected over iterations, including
+                                'true_positives' and 'false_negatives'.
 
     Displays:
-        A matplotlib plot embedded in the Streamlit app showing the counts of True Positives
-        and False Negatives over iterations.
+        A Streamlit line chart showing the counts of True Positives and False Negatives
+        over iterations.
     """
-    if not metrics_history:
+    tps = metrics_history['true_positives']
+    fns = metrics_history['false_negatives']
+    if len(tps) == 0:
         st.write("No metrics to display yet.")
         return
 
-    iterations = list(range(1, len(metrics_history) + 1))
-    tps = [metrics['true_positives'] for metrics in metrics_history]
-    fns = [metrics['false_negatives'] for metrics in metrics_history]
-
-    fig, ax = plt.subplots()
-    ax.plot(iterations, tps, label='True Positives', color='green')
-    ax.plot(iterations, fns, label='False Negatives', color='red')
-    ax.set_title('Model Performance Over Time')
-    ax.set_xlabel('Iteration')
-    ax.set_ylabel('Count')
-    ax.legend()
-    st.pyplot(fig)
+    data = pd.DataFrame(
+        {'True Positives': tps, 'False Negatives': fns},
+        index=pd.RangeIndex(1, len(tps) + 1, name='Iteration')
+    )
+    st.line_chart(data, x_label='Iteration', y_label='Count', color=['#008000', '#ff0000'])
 
 def plot_recall_over_time(metrics_history):
     """
     Plots the recall metric over time.
 
     Parameters:
-        metrics_history (list): A list of metrics dictionaries collected over iterations.
+        metrics_history (dict): Arrays of metrics collected over iterations, including 'recall'.
 
     Displays:
-        A matplotlib plot embedded in the Streamlit app showing the recall over iterations.
+        A Streamlit line chart showing the recall over iterations.
     """
-    if not metrics_history:
+    recalls = metrics_history['recall']
+    if len(recalls) == 0:
         st.write("No metrics to display yet.")
         return
 
-    iterations = list(range(1, len(metrics_history) + 1))
-    recalls = []
-    for metrics in metrics_history:
-        tp = metrics['true_positives']
-        fn = metrics['false_negatives']
-        recall = tp / (tp + fn) if (tp + fn) > 0 else 0.0
-        recalls.append(recall)
-
-    fig, ax = plt.subplots()
-    ax.plot(iterations, recalls, label='Recall', color='blue')
-    ax.set_title('Recall Over Time')
-    ax.set_xlabel('Iteration')
-    ax.set_ylabel('Recall')
-    ax.set_ylim(0, 1)
-    ax.legend()
-    st.pyplot(fig)
+    data = pd.DataFrame({'Recall': recalls}, index=pd.RangeIndex(1, len(recalls) + 1, name='Iteration'))
+    st.line_chart(data, x_label='Iteration', y_label='Recall', color='#0000ff')